@@ -1,6 +1,27 @@
 # coding=utf-8
 """Shared tools used for building, managing and solving all Advent of Code projects."""
 
-from aoc_tools.puzzle_building import AdventBuilder
-from aoc_tools.puzzle_solving import AdventCalendar, AdventSolver, read_puzzle_input
-from aoc_tools import algorithms
+# Standard library imports:
+from importlib import import_module
+
+# Map each exported attribute to the submodule defining it:
+_LAZY_ATTRS = {
+    "AdventBuilder": "aoc_tools.puzzle_building",
+    "AdventCalendar": "aoc_tools.puzzle_solving",
+    "AdventSolver": "aoc_tools.puzzle_solving",
+    "iter_puzzle_input": "aoc_tools.puzzle_solving",
+    "read_puzzle_input": "aoc_tools.puzzle_solving",
+    "algorithms": "aoc_tools.algorithms",
+}
+__all__ = sorted(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    """Load exported attributes on first access, caching them in the globals."""
+    try:
+        module = import_module(_LAZY_ATTRS[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = module if name == "algorithms" else getattr(module, name)
+    globals()[name] = value
+    return value
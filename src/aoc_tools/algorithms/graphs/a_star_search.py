@@ -5,22 +5,31 @@
 import abc
 from collections.abc import Callable, Hashable, Iterable
 import heapq
+from itertools import count
 import math
 from typing import TypeVar
 
+# Local application imports:
+from aoc_tools.algorithms.graphs.bucket_queue import BucketQueue
+
 # Define custom types:
 Node = TypeVar("Node", bound="ASNode")
 GoalFunc = Callable[[Node], bool]
+HeuristicFunc = Callable[[Node], int]
 
 
 class ASNode(metaclass=abc.ABCMeta):
     """ABC for an individual node in an A* search algorithm."""
-    __slots__ = ["_id", "_hash", "_parent"]
+    __slots__ = ["_id", "_hash", "_parent", "_g", "_h", "_f"]
 
-    def __init__(self: Node, id_: Hashable, hash_: int, parent: Node = None):
+    def __init__(self: Node, id_: Hashable, hash_: int, g: int, h: int,
+                 parent: Node = None):
         self._id = id_
         self._hash = hash_
         self._parent = parent
+        self._g = g
+        self._h = h
+        self._f = g + h
 
     def __hash__(self) -> int:
         return self._hash
@@ -28,28 +37,28 @@ class ASNode(metaclass=abc.ABCMeta):
     def __eq__(self: Node, other: Node) -> bool:
         return self._id == other._id
 
-    def __lt__(self: Node, other: Node) -> bool:
-        return self.f < other.f
-
     def __repr__(self) -> str:
-        return f"{self._id}: {self.g}"
+        return f"{self._id}: {self._g}"
 
     @property
     def f(self) -> int:
         """Provide the sum of the known 'g' and estimated 'h' costs."""
-        return self.g + self.h
+        return self._f
 
     @property
-    @abc.abstractmethod
     def g(self) -> int:
-        """Compute the cost for reaching this ASNode from the search start point."""
-        raise NotImplementedError
+        """Provide the cost for reaching this ASNode from the search start point."""
+        return self._g
 
     @property
-    @abc.abstractmethod
     def h(self) -> int:
-        """Estimate the cost for reaching the search goal from this ASNode."""
-        raise NotImplementedError
+        """Provide the estimated cost for reaching the search goal from this ASNode."""
+        return self._h
+
+    @property
+    def id(self) -> Hashable:
+        """Provide the hashable id stored for this ASNode at construction."""
+        return self._id
 
     @property
     def parent(self: Node) -> Node | None:
@@ -59,38 +68,150 @@ class ASNode(metaclass=abc.ABCMeta):
     @property
     def lineage(self: Node) -> list[Node]:
         """List this ASNode and its recursive parents (if any)."""
-        return [self] + (self.parent.lineage if self.parent else [])
+        nodes = []
+        node = self
+        while node is not None:
+            nodes.append(node)
+            node = node._parent
+        return nodes
 
     @abc.abstractmethod
     def get_successors(self: Node) -> Iterable[Node]:
         """List all nodes to search that are directly reachable from this ASNode."""
         raise NotImplementedError
 
+    def get_predecessors(self: Node) -> Iterable[Node]:
+        """List all nodes to search from which this ASNode is directly reachable.
+
+        Only required by a_star_bidirectional, for expanding the search rooted
+        at the goal node; unidirectional searches never call this method.
+        """
+        raise NotImplementedError
+
 
-def a_star_search(start: Node, goal_func: GoalFunc) -> Node:
-    """Find the path of lesser cost for reaching a goal objective from a start node."""
-    # Build search registers:
-    pending_nodes = [start]
-    visited_nodes = set()
-    best_g_costs = {start: start.g}
+class _HeapQueue:
+    """Fallback priority queue based on heapq, for non-integer priorities."""
+    __slots__ = ["_heap", "_count"]
+
+    def __init__(self):
+        self._heap = []
+        self._count = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, priority, item):
+        """Store an item as a (priority, tiebreak, item) heap entry."""
+        heapq.heappush(self._heap, (priority, next(self._count), item))
+
+    def pop(self):
+        """Remove and return one item with the lowest stored priority."""
+        return heapq.heappop(self._heap)[2]
+
+
+def a_star_search(start: Node, goal_func: GoalFunc, heuristic: HeuristicFunc = None,
+                  f_bound: int = None) -> Node:
+    """Find the path of lesser cost for reaching a goal objective from a start node.
+
+    An optional heuristic callable (e.g. one built with build_alt_heuristic)
+    may override the h cost estimated by the nodes themselves; queue priorities
+    then become g + heuristic(node) instead of the nodes' f cost.
+
+    When all f costs are known to be integers within [0, f_bound], providing
+    that bound swaps the heapq-based queue for an O(1) bucket queue holding
+    f_bound + 1 buckets; out-of-bound priorities raise ValueError.
+    """
+    # Build search registers (bounded integer f costs allow an O(1) bucket queue):
+    start_f = start._f if heuristic is None else start._g + heuristic(start)
+    pending_nodes = _HeapQueue() if f_bound is None else BucketQueue(
+        max_priority=f_bound)
+    pending_nodes.push(start_f, start)
+    best_g_costs = {start._id: start._g}
+    # Bind hot methods to locals, to avoid repeated lookups in the inner loop:
+    push, pop = pending_nodes.push, pending_nodes.pop
+    get_best_g = best_g_costs.get
     # Check each pending node one at a time, from lowest to greatest g cost:
     while pending_nodes:
-        q_node = heapq.heappop(pending_nodes)
+        q_node = pop()
         # Stop if the goal is reached:
         if goal_func(q_node):
             return q_node
-        if q_node in visited_nodes:
-            continue  # Skip node if its location was already visited.
+        best_g = get_best_g(q_node._id)
+        if best_g is not None and q_node._g > best_g:
+            continue  # Skip stale entry dominated by a cheaper duplicate.
         # For each possible successor node:
         for s_node in q_node.get_successors():
-            if s_node in visited_nodes:
-                continue  # Skip successor if it was already visited:
-            if s_node.g >= best_g_costs.get(s_node, math.inf):
-                continue  # Skip successor if worse than its hash's best cost.
+            s_id, s_g = s_node._id, s_node._g
+            best_s_g = get_best_g(s_id)
+            if best_s_g is not None and s_g >= best_s_g:
+                continue  # Skip successor if not better than its id's best cost.
+            best_g_costs[s_id] = s_g
             # Register successor node for future checking:
-            heapq.heappush(pending_nodes, s_node)
-            best_g_costs[s_node] = s_node.g
-        # Register the original node as already seen:
-        visited_nodes.add(q_node)
+            push(s_node._f if heuristic is None else s_g + heuristic(s_node), s_node)
     # If code reaches this point, the goal was never reached:
     raise ValueError("The search could not reach the goal node.")
+
+
+def build_alt_heuristic(distance_maps: Iterable[dict[Hashable, int]],
+                        goal_id: Hashable) -> HeuristicFunc:
+    """Build an ALT (A*, Landmarks, Triangle inequality) heuristic callable.
+
+    Each distance map holds the real distances from one landmark node to every
+    node id, precomputed once (e.g. with a full Dijkstra run per landmark).
+    The triangle inequality turns those distances into an admissible estimate:
+    h(node) = max(|dist_L[node] - dist_L[goal]|) over all landmarks L.
+    """
+    goal_distances = [(d_map, d_map[goal_id]) for d_map in distance_maps]
+
+    def heuristic(node: Node) -> int:
+        """Estimate the cost for reaching the goal id from the target node."""
+        node_id = node._id
+        return max(abs(d_map[node_id] - goal_d) for d_map, goal_d in goal_distances)
+    return heuristic
+
+
+def a_star_bidirectional(start: Node, goal: Node) -> tuple[Node, Node]:
+    """Find the path of lesser cost between two nodes, searching from both ends.
+
+    A forward search expands successors from the start node while a backward
+    search expands predecessors from the goal node; each frontier only needs to
+    cover about half of the path length. The forward nodes must estimate their
+    h cost towards the goal, and the backward nodes towards the start. Returns
+    the pair of meeting nodes: the best full path is the forward node's lineage
+    plus the backward node's reversed lineage.
+    """
+    # Build one set of search registers per search direction:
+    entry_count = count()
+    frontiers = [[(start._f, next(entry_count), start)],
+                 [(goal._f, next(entry_count), goal)]]
+    best_g_costs = [{start._id: start._g}, {goal._id: goal._g}]
+    best_nodes = [{start._id: start}, {goal._id: goal}]
+    meet_cost, meet_pair = math.inf, None
+    # Expand the smaller frontier one node at a time, until they cannot meet better:
+    while frontiers[0] and frontiers[1]:
+        if meet_pair and min(frontiers[0][0][0], frontiers[1][0][0]) >= meet_cost:
+            break  # Neither frontier holds an entry below the best meeting cost.
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        _, _, q_node = heapq.heappop(frontiers[side])
+        q_id, q_g = q_node._id, q_node._g
+        if q_g > best_g_costs[side].get(q_id, math.inf):
+            continue  # Skip stale entry dominated by a cheaper duplicate.
+        # Check if this node improves the meeting point with the opposite search:
+        other_g = best_g_costs[1 - side].get(q_id)
+        if other_g is not None and q_g + other_g < meet_cost:
+            meet_cost = q_g + other_g
+            pair = q_node, best_nodes[1 - side][q_id]
+            meet_pair = pair if side == 0 else pair[::-1]
+        # Register each improving neighbour node for future checking:
+        neighbours = q_node.get_successors() if side == 0 else q_node.get_predecessors()
+        for s_node in neighbours:
+            s_id, s_g = s_node._id, s_node._g
+            if s_g >= best_g_costs[side].get(s_id, math.inf):
+                continue  # Skip neighbour if worse than its id's best cost.
+            best_g_costs[side][s_id] = s_g
+            best_nodes[side][s_id] = s_node
+            heapq.heappush(frontiers[side], (s_node._f, next(entry_count), s_node))
+    # Fail if the two searches never met:
+    if meet_pair is None:
+        raise ValueError("The search could not connect the start and goal nodes.")
+    return meet_pair
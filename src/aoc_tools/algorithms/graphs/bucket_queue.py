@@ -0,0 +1,37 @@
+# coding=utf-8
+"""Bucket-based priority queue for searches with bounded integer priorities."""
+
+
+class BucketQueue:
+    """Priority queue indexing items by integer priority, with O(1) push/pop."""
+    __slots__ = ["_buckets", "_max_priority", "_min_idx", "_size"]
+
+    def __init__(self, max_priority: int):
+        self._buckets: list[list] = [[] for _ in range(max_priority + 1)]
+        self._max_priority = max_priority
+        self._min_idx = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, priority: int, item):
+        """Store an item under the bucket matching its integer priority."""
+        if not 0 <= priority <= self._max_priority:
+            raise ValueError(
+                f"The priority {priority} is outside [0, {self._max_priority}].")
+        self._buckets[priority].append(item)
+        if priority < self._min_idx:
+            self._min_idx = priority
+        self._size += 1
+
+    def pop(self):
+        """Remove and return one item from the lowest non-empty priority bucket."""
+        if self._size == 0:
+            raise IndexError("Pop from an empty BucketQueue.")
+        buckets, idx = self._buckets, self._min_idx
+        while not buckets[idx]:
+            idx += 1
+        self._min_idx = idx
+        self._size -= 1
+        return buckets[idx].pop()
@@ -21,27 +21,69 @@ class FNode(metaclass=abc.ABCMeta):
     def __hash__(self) -> int:
         return self._hash
 
+    def __eq__(self: Node, other: Node) -> bool:
+        return self._id == other._id
+
     def __repr__(self) -> str:
         return repr(self._id)
 
+    @property
+    def id(self) -> Hashable:
+        """Provide the hashable id stored for this FNode at construction."""
+        return self._id
+
     @abc.abstractmethod
     def get_successors(self: Node) -> set[Node]:
         """List all nodes to search that are directly reachable from this FNode."""
         raise NotImplementedError
 
 
-def full_search(start: Node) -> set[Node]:
-    """Find all nodes that can be reached from a start node."""
+def full_search(start: Node, id_bound: int = None) -> set[Node]:
+    """Find all nodes that can be reached from a start node.
+
+    When nodes use dense integer ids (e.g. row-major grid indexes), providing
+    their exclusive upper bound swaps the visited-membership set for a flat
+    byte array, making each membership test a single indexed byte read.
+    """
+    if id_bound is not None:
+        return _full_search_indexed(start=start, id_bound=id_bound)
+    # Build search registers:
+    pending_nodes = [start]
+    visited_nodes = {start}
+    # Bind hot methods to locals, to avoid repeated lookups in the inner loop:
+    pop, append = pending_nodes.pop, pending_nodes.append
+    add_visited = visited_nodes.add
+    # Check every pending node one at a time (order doesn't matter):
+    while pending_nodes:
+        q_node = pop()
+        # Register all non-visited successor nodes for future checking:
+        for s_node in q_node.get_successors():
+            if s_node not in visited_nodes:
+                add_visited(s_node)
+                append(s_node)
+    # When the code reaches this point, all reachable nodes have been visited:
+    return visited_nodes
+
+
+def _full_search_indexed(start: Node, id_bound: int) -> set[Node]:
+    """Run a full search tracking visited integer ids in a flat byte array."""
     # Build search registers:
     pending_nodes = [start]
-    visited_nodes = set()
+    visited_ids = bytearray(id_bound)
+    visited_ids[start._id] = True
+    visited_nodes = {start}
+    # Bind hot methods to locals, to avoid repeated lookups in the inner loop:
+    pop, append = pending_nodes.pop, pending_nodes.append
+    add_visited = visited_nodes.add
     # Check every pending node one at a time (order doesn't matter):
     while pending_nodes:
-        q_node = pending_nodes.pop()
+        q_node = pop()
         # Register all non-visited successor nodes for future checking:
-        s_nodes = q_node.get_successors() - visited_nodes
-        pending_nodes.extend(s_nodes)
-        # Register the original node as already seen:
-        visited_nodes.add(q_node)
+        for s_node in q_node.get_successors():
+            s_id = s_node._id
+            if not visited_ids[s_id]:
+                visited_ids[s_id] = True
+                add_visited(s_node)
+                append(s_node)
     # When the code reaches this point, all reachable nodes have been visited:
     return visited_nodes
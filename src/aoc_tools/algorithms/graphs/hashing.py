@@ -0,0 +1,20 @@
+# coding=utf-8
+"""Fast hash helpers for precomputing the stored hash of search nodes."""
+
+# FNV-1a 32-bit parameters:
+_FNV_OFFSET = 2166136261
+_FNV_PRIME = 16777619
+_FNV_MASK = 0xFFFFFFFF
+
+
+def fnv1a_hash(*components: int) -> int:
+    """Combine integer components into a 32-bit FNV-1a hash.
+
+    Suited for building the hash_ value of ASNode/FNode subclasses from small
+    bounded coordinates: cheaper than hashing a freshly allocated tuple, and
+    better distributed for grid traversals than CPython's small-int hash.
+    """
+    value = _FNV_OFFSET
+    for component in components:
+        value = ((value ^ component) * _FNV_PRIME) & _FNV_MASK
+    return value
@@ -2,9 +2,11 @@
 """Define the PixelParser pixels-to-string conversion tool."""
 
 # Standard library imports:
-from collections.abc import Iterable
 from pathlib import Path
 
+# Third party imports:
+import numpy
+
 # Local application imports:
 from aoc_tools.puzzle_solving import read_puzzle_input
 
@@ -14,22 +16,32 @@ DATA_PATH = Path(__file__).parent / "data"
 
 class PixelChar:
     """Group of 4x6 on/off pixels encoding a single string character."""
+    __slots__ = ["bits"]
+
     def __init__(self, pixels: list[str], on: str = "█", off: str = " "):
-        self.pixels = self._encode(pixels=pixels, on=on, off=off)
+        self.bits = self._encode(pixels=pixels, on=on, off=off)
 
     def __repr__(self) -> str:
-        return str(self.pixels)
+        return str(self.bits)
 
     def __eq__(self, other: "PixelChar") -> bool:
-        return self.pixels == other.pixels
+        return self.bits == other.bits
 
     def __hash__(self) -> int:
-        return hash(self.pixels)
+        return self.bits
 
     @staticmethod
-    def _encode(pixels: list[str], on: str, off: str) -> str:
-        """Transform the lines of string pixels into a 1|0 string number."""
-        return "".join(pixels).replace(on, "0").replace(off, "1")
+    def _encode(pixels: list[str], on: str, off: str) -> int:
+        """Transform the lines of string pixels into a 24-bit integer."""
+        return int("".join(pixels).replace(on, "0").replace(off, "1"), 2)
+
+    @classmethod
+    def from_array(cls, on_array: numpy.ndarray) -> "PixelChar":
+        """Build a new PixelChar from a 2D boolean array (True where pixel is on)."""
+        char = cls.__new__(cls)
+        packed = numpy.packbits(~on_array.ravel())
+        char.bits = int.from_bytes(packed.tobytes(), "big")
+        return char
 
 
 class PixelParser:
@@ -48,24 +60,23 @@ class PixelParser:
 
     def process(self, pixel_lines: list[str]) -> str:
         """Transform a 40 x 6 pixels image into an 8-characters string."""
-        on, off = self.on, self.off
-        self._validate_image(pixel_lines=pixel_lines)
-        characters = self._separate_chars(pixel_lines=pixel_lines)
-        pixel_chars = [PixelChar(pixels=pixels, on=on, off=off) for pixels in characters]
+        array = self._as_array(pixel_lines=pixel_lines)
+        self._validate_image(array=array)
+        on_array = array == ord(self.on)
+        pixel_chars = [PixelChar.from_array(on_array=on_array[:, j * 5:j * 5 + 4])
+                       for j in range(8)]
         return "".join(self.char_map[pixel_char] for pixel_char in pixel_chars)
 
-    def _validate_image(self, pixel_lines: list[str]):
-        """Check that the provided image meets the requirements to be processed."""
+    @staticmethod
+    def _as_array(pixel_lines: list[str]) -> numpy.ndarray:
+        """Convert the lines of string pixels into a 2D array of character codes."""
         assert len(pixel_lines) == 6  # 6-row image.
-        assert set("".join(pixel_lines)) == {self.off, self.on}  # Only on/off chars.
-        for line in pixel_lines:
-            assert len(line) == 8 * 5  # 8 x (four-wide letter + white space) width.
-            assert all(line[j] == self.off for j in range(4, 41, 5))  # Char separations.
+        joined = "".join(pixel_lines)
+        assert len(joined) == 6 * 8 * 5  # 8 x (four-wide letter + white space) width.
+        codes = numpy.frombuffer(joined.encode("utf-32-le"), dtype=numpy.uint32)
+        return codes.reshape(6, 40)
 
-    @staticmethod
-    def _separate_chars(pixel_lines: list[str]) -> Iterable[list[str]]:
-        """Slice provided lines of pixels by vertical separators between pixel chars."""
-        for j in range(8):
-            char_start = j * 5
-            char_end = (j + 1) * 5 - 1
-            yield [line[char_start:char_end] for line in pixel_lines]
+    def _validate_image(self, array: numpy.ndarray):
+        """Check that the provided image meets the requirements to be processed."""
+        assert set(numpy.unique(array)) == {ord(self.off), ord(self.on)}  # On/off only.
+        assert (array[:, 4::5] == ord(self.off)).all()  # Char separations.
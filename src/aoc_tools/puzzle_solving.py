@@ -2,8 +2,15 @@
 """Tools used when computing and storing the solutions of advent puzzles."""
 
 # Standard library imports:
+from bisect import bisect_right
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
+from io import StringIO
 from pathlib import Path
+import re
 from time import time
 
 # Third party imports:
@@ -13,12 +20,35 @@ import pandas
 from aoc_tools.constants import MODULE_DAILY_SCRIPT
 from aoc_tools.constants import URL_ADVENT_PUZZLE, URL_GITHUB_SCRIPT
 
+# Set constants:
+RX_HYPER_LINK = re.compile(r"^\[(?P<value>.+)]\(.+\)$")
+RX_TIMING = re.compile(r"^(?P<value>[\d.]+) (?P<units>.+)$")
+STAR_COUNTS = {"-": 0, ":star:": 1, ":star::star:": 2}
+TIMING_UNIT_BOUNDS = (1e-4, 1e-1, 1.5 * 60, 1.5 * 3600)
+TIMING_UNIT_FACTORS = {"h": 3600.0, "min": 60.0, "s": 1.0, "ms": 1e-3, "μs": 1e-6}
+TIMING_UNIT_NAMES = ("μs", "ms", "s", "min", "h")
+
+
+@lru_cache(maxsize=None)
+def _import_solution_module(module_name: str):
+    """Import a daily-solution module once, remembering missing days as None."""
+    try:
+        return import_module(module_name)
+    except ModuleNotFoundError:
+        return None
+
+
+def iter_puzzle_input(input_file: Path, encoding: str = "utf-8") -> Iterator[str]:
+    """Read, process and yield each line in the input file for the target day."""
+    with open(input_file, mode="r", encoding=encoding, buffering=2 ** 20) as file:
+        for line in file:
+            yield line.removesuffix("\n")
+
 
 def read_puzzle_input(input_file: Path, encoding: str = "utf-8") -> list[str]:
     """Read, process and return each line in the input file for the target day."""
     with open(input_file, mode="r", encoding=encoding) as file:
-        lines = [line.removesuffix("\n") for line in file]
-    return lines
+        return file.read().splitlines()
 
 
 class AdventSolver:
@@ -29,8 +59,17 @@ class AdventSolver:
 
     def print_day(self, day: int):
         """Print the solutions and execution time for the target day's puzzles."""
+        self._print_solutions(day=day, solutions=self.solve_day(day=day))
+
+    def print_all_days(self):
+        """Print the solutions and execution times for each day's puzzles."""
+        for day, solutions in enumerate(self.solve_all_days(), start=1):
+            self._print_solutions(day=day, solutions=solutions)
+
+    def _print_solutions(self, day: int, solutions: tuple[int | None, int | None, str]):
+        """Print the already-computed solutions for the target day's puzzles."""
         print(self.puzzles[day - 1])
-        solution_1, solution_2, timing = self.solve_day(day=day)
+        solution_1, solution_2, timing = solutions
         if solution_1 is None:
             print("    The first puzzle remains unsolved!")
         else:
@@ -42,36 +81,32 @@ class AdventSolver:
         if solution_1 is not None or solution_2 is not None:
             print(f"    This took {timing}.")
 
-    def print_all_days(self):
-        """Print the solutions and execution times for each day's puzzles."""
-        for day in range(1, len(self.puzzles) + 1):
-            self.print_day(day=day)
-
     def solve_day(self, day: int) -> tuple[int | None, int | None, str]:
         """Get the solutions and execution time for the target day's puzzles."""
-        try:
-            module_name = MODULE_DAILY_SCRIPT.substitute(year=self.year, day=day)
-            module = import_module(module_name)
-        except ModuleNotFoundError:
+        module_name = MODULE_DAILY_SCRIPT.substitute(year=self.year, day=day)
+        module = _import_solution_module(module_name)
+        if module is None:
             return None, None, ""
+        warm_up = getattr(module, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
         start = time()
         solution_1, solution_2 = module.compute_solution()
         timing = self.format_timing(value=time() - start)
         return solution_1, solution_2, timing
 
+    def solve_all_days(self) -> list[tuple[int | None, int | None, str]]:
+        """Get the solutions and execution times for each day's puzzles, in parallel."""
+        days = range(1, len(self.puzzles) + 1)
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(self.solve_day, day) for day in days]
+            return [future.result() for future in futures]
+
     @staticmethod
     def format_timing(value: float) -> str:
         """Format a time value in seconds into a time string with sensitive units."""
-        if value >= 1.5 * 3600:
-            return f"{value / 3600:.2f} h"
-        elif value >= 1.5 * 60:
-            return f"{value / 60:.2f} min"
-        elif value <= 1e-4:
-            return f"{value * 1e6:.2f} μs"
-        elif value <= 1e-1:
-            return f"{value * 1e3:.2f} ms"
-        else:
-            return f"{value:.2f} s"
+        units = TIMING_UNIT_NAMES[bisect_right(TIMING_UNIT_BOUNDS, value)]
+        return f"{value / TIMING_UNIT_FACTORS[units]:.2f} {units}"
 
     @staticmethod
     def parse_timing(value: str) -> float:
@@ -79,16 +114,7 @@ class AdventSolver:
         if value == "-":
             return 0
         value, units = value.split(" ")
-        if units == "h":
-            return float(value) * 3600
-        elif units == "min":
-            return float(value) * 60
-        elif units == "μs":
-            return float(value) / 1e6
-        elif units == "ms":
-            return float(value) / 1e3
-        else:
-            return float(value)
+        return float(value) * TIMING_UNIT_FACTORS[units]
 
 
 class AdventCalendar:
@@ -97,18 +123,30 @@ class AdventCalendar:
                  data: pandas.DataFrame = None):
         self._readme_file = readme_file
         self._solver = solver
+        self._puzzle_names = [
+            name.split(": ")[1] if name != "-" else "-" for name in solver.puzzles]
+        days = range(1, len(solver.puzzles) + 1)
+        self._puzzle_urls = [
+            URL_ADVENT_PUZZLE.substitute(day=day, year=solver.year) for day in days]
+        self._solution_urls = [
+            URL_GITHUB_SCRIPT.substitute(day=day, year=solver.year) for day in days]
+        self._defer_write = False
+        self._readme_lines = self._read_readme()
         self._table_start = self._find_table_start()
         self.data = data if data is not None else self._load_from_readme()
 
+    def _read_readme(self) -> list[str]:
+        """Read and store all the text lines in the README file."""
+        with open(self._readme_file, mode="r", encoding="utf-8") as file:
+            return file.readlines()
+
     def _find_table_start(self) -> int:
         """Locate the first line numbers of the README file's puzzle calendar table."""
-        with open(self._readme_file, mode="r") as file:
-            lines = file.readlines()
-        section_found = True
-        for n, line in enumerate(lines):
+        section_found = False
+        for n, line in enumerate(self._readme_lines):
             if line == "### Puzzle calendar:\n":
                 section_found = True
-            if section_found and line.startswith("| "):
+            elif section_found and line.startswith("| "):
                 return n
 
     def _load_from_readme(self) -> pandas.DataFrame:
@@ -118,19 +156,21 @@ class AdventCalendar:
 
     def _extract_readme_rows(self) -> list[str]:
         """Extract all the puzzle calendar lines printed in the README file."""
-        with open(self._readme_file, mode="r", encoding="utf-8") as file:
-            lines = file.readlines()
+        lines = self._readme_lines
         headers = lines[self._table_start]
         data_lines = lines[self._table_start + 2:self._table_start + 27]
         return [headers] + data_lines
 
     def _process_readme_rows(self, raw_rows: list[str]) -> pandas.DataFrame:
         """Convert raw calendar lines from the README file into a pandas.DataFrame."""
-        rows = [row.removeprefix("|").removesuffix("|\n") for row in raw_rows]
-        headers = [r.replace("**", "").strip() for r in rows[0].split("|")]
-        data = [[value.strip() for value in row.split("|")] for row in rows[1:]]
-        data = [[value if value != "" else "-" for value in row] for row in data]
-        df = pandas.DataFrame(data=data, columns=headers)
+        buffer = StringIO("".join(raw_rows))
+        df = pandas.read_csv(
+            buffer, sep="|", skipinitialspace=True, header=0, dtype=str,
+            na_filter=False, engine="c").iloc[:, 1:-1]
+        df.columns = [name.replace("**", "").strip() for name in df.columns]
+        for column in df.columns:
+            df[column] = df[column].str.strip()
+        df = df.replace(to_replace="", value="-")
         df = self._remove_hyper_links(data_frame=df)
         df["Day"] = df["Day"].astype(int)
         return df.set_index(keys="Day")
@@ -147,37 +187,55 @@ class AdventCalendar:
 
     def register_all_days(self):
         """Add the data for each day's puzzles to the README file's calendar."""
-        for day in range(1, len(self._solver.puzzles) + 1):
-            self._solve_day(day=day)
+        for day, solutions in enumerate(self._solver.solve_all_days(), start=1):
+            self._store_solutions(day=day, solutions=solutions)
         self._write_to_readme()
 
     def register_day(self, day: int):
         """Add the data for the target day's puzzles to the README file's calendar."""
         self._solve_day(day=day)
-        self._write_to_readme()
+        if not self._defer_write:
+            self._write_to_readme()
+
+    @contextmanager
+    def batch_writes(self):
+        """Defer README writes from register_day calls until the block completes."""
+        self._defer_write = True
+        try:
+            yield self
+        finally:
+            self._defer_write = False
+            self._write_to_readme()
 
     def _solve_day(self, day: int):
         """Fill rows with missing solutions or timing values."""
-        s1, s2, timing = self._solver.solve_day(day=day)
-        self.data.loc[day, "Solution 1"] = s1 or "-"
-        self.data.loc[day, "Solution 2"] = s2 or "-"
-        self.data.loc[day, "Time"] = timing or "-"
+        self._store_solutions(day=day, solutions=self._solver.solve_day(day=day))
+
+    def _store_solutions(self, day: int, solutions: tuple[int | None, int | None, str]):
+        """Fill the target day's row with the provided solutions and timing values."""
+        s1, s2, timing = solutions
         stars = ":star::star:" if s1 and s2 else ":star:" if s1 or s2 else "-"
-        self.data.loc[day, "Stars"] = stars
+        self.data.loc[day, ["Solution 1", "Solution 2", "Time", "Stars"]] = [
+            str(s1) if s1 else "-", str(s2) if s2 else "-", timing or "-", stars]
 
     def _write_to_readme(self):
         """Replace the calendar table in the README file with the stored one."""
-        with open(self._readme_file, mode="r", encoding="utf-8") as file:
-            lines = file.readlines()
-        lines[self._table_start:self._table_start + 29] = self._table_as_lines()
+        table_lines = self._table_as_lines()
+        prefix = self._readme_lines[:self._table_start]
+        suffix = self._readme_lines[self._table_start + len(table_lines):]
+        self._readme_lines = prefix + table_lines + suffix
         with open(self._readme_file, mode="w", encoding="utf-8") as file:
-            file.writelines(lines)
+            file.write("".join(prefix))
+            file.write("".join(table_lines))
+            file.write("".join(suffix))
 
     def _table_as_lines(self) -> list[str]:
         """Convert the stored calendar table into text lines."""
-        data = self.data.copy(deep=True).reset_index(drop=False)
-        total_time = sum(self._solver.parse_timing(value=value) for value in data["Time"])
-        total_stars = sum(data["Stars"].str.count(":star:"))
+        data = self.data.reset_index(drop=False)
+        timings = data["Time"].str.extract(RX_TIMING)
+        total_time = float((timings["value"].astype(float) * timings["units"].map(
+            TIMING_UNIT_FACTORS)).sum())
+        total_stars = int(data["Stars"].map(STAR_COUNTS).sum())
         totals = pandas.DataFrame(data="-", columns=data.columns, index=[0])
         totals.loc[:, "Day"] = "**Totals**"
         totals.loc[:, "Stars"] = f"**{total_stars}**:star:"
@@ -185,34 +243,34 @@ class AdventCalendar:
         data = self._add_puzzle_names(data_frame=data)
         data = self._add_hyper_links(data_frame=data)
         data = pandas.concat(objs=[data, totals], ignore_index=True)
-        data.columns = [f"**{name}**" for name in data.columns]
-        text = data.to_markdown(
-            index=False, tablefmt="pipe",
-            colalign=("center", "left", "center", "center", "center", "center"))
-        return (text + "\n").splitlines(keepends=True)
+        header = "| " + " | ".join(f"**{name}**" for name in data.columns) + " |\n"
+        separator = "|:---:|:---|:---:|:---:|:---:|:---:|\n"
+        rows = ["| " + " | ".join(row) + " |\n" for row in data.to_numpy().tolist()]
+        return [header, separator] + rows
 
     def _add_puzzle_names(self, data_frame: pandas.DataFrame) -> pandas.DataFrame:
         """Update the puzzle names from the global daily-names map."""
-        data_frame["Puzzle"] = [
-            name.split(": ")[1] if name != "-" else "-" for name in self._solver.puzzles]
+        data_frame["Puzzle"] = self._puzzle_names
         return data_frame
 
     def _add_hyper_links(self, data_frame: pandas.DataFrame) -> pandas.DataFrame:
         """Add hyperlinks to puzzle pages and to solution scripts in GitHub."""
-        for idx, (day, puzzle, stars, s1, s2, timing) in data_frame.iterrows():
-            link_puzzle = URL_ADVENT_PUZZLE.substitute(day=day, year=self._solver.year)
-            link_solution = URL_GITHUB_SCRIPT.substitute(day=day, year=self._solver.year)
-            data_frame.loc[idx, "Day"] = f"[{day}]({link_puzzle})"
-            data_frame.loc[idx, "Puzzle"] = f"[{puzzle}]({link_puzzle})"
-            if s1 != "-" or s2 != "-":
-                data_frame.loc[idx, "Stars"] = f"[{stars}]({link_solution})"
-                data_frame.loc[idx, "Solution 1"] = f"[{s1}]({link_solution})"
-                data_frame.loc[idx, "Solution 2"] = f"[{s2}]({link_solution})"
-                data_frame.loc[idx, "Time"] = f"[{timing}]({link_solution})"
+        index = data_frame.index
+        links_puzzle = pandas.Series(self._puzzle_urls, index=index)
+        links_solution = pandas.Series(self._solution_urls, index=index)
+        solved = (data_frame["Solution 1"] != "-") | (data_frame["Solution 2"] != "-")
+        data_frame["Day"] = "[" + data_frame["Day"].astype(str) + "](" + links_puzzle + ")"
+        data_frame["Puzzle"] = "[" + data_frame["Puzzle"] + "](" + links_puzzle + ")"
+        for column in ["Stars", "Solution 1", "Solution 2", "Time"]:
+            values = data_frame[column]
+            data_frame[column] = values.where(
+                ~solved, "[" + values + "](" + links_solution + ")")
         return data_frame
 
     @staticmethod
     def _remove_hyper_links(data_frame: pandas.DataFrame) -> pandas.DataFrame:
         """Remove web hyperlinks for all cells."""
-        rx_find, rx_sub = r"^\[(?P<value>.+)]\(.+\)$", r"\g<value>"
-        return data_frame.replace(to_replace=rx_find, value=rx_sub, regex=True)
+        for column in data_frame.columns:
+            extracted = data_frame[column].str.extract(RX_HYPER_LINK, expand=False)
+            data_frame[column] = extracted.where(extracted.notna(), data_frame[column])
+        return data_frame
@@ -14,16 +14,30 @@ RGB = tuple[float, float, float]
 RGB255 = tuple[int, int, int]
 Colour = str | RGB | RGB255
 
+# Set constants:
+BASE_RGB_COLOURS: tuple[RGB, ...] = tuple(
+    tuple(map(float, colour)) for colour in BASE_COLORS.values())
+
 
 class ValuePalette:
     """Map scalar values to specific RGB colours."""
     def __init__(self, value_map: dict[Scalar, Colour], default: Colour = "black"):
         self._palette = {v: self._translate_colour(c) for v, c in value_map.items()}
         self._default = self._translate_colour(colour=default)
+        self._int_lut = self._build_int_lut()
 
     def __getitem__(self, value: Scalar) -> RGB:
         return self._palette.get(value, self._default)
 
+    def _build_int_lut(self) -> numpy.ndarray | None:
+        """Build a direct colour lookup table for contiguous integer value maps."""
+        keys = sorted(self._palette) if all(
+            isinstance(key, int) for key in self._palette) else None
+        if keys != list(range(len(self._palette))):
+            return None
+        rows = [self._palette[key] for key in keys] + [self._default]
+        return numpy.asarray(rows, dtype=numpy.float32)
+
     @staticmethod
     def _translate_colour(colour: Colour) -> RGB:
         """Translate a compatible colour definition into a RGB value."""
@@ -38,11 +52,15 @@ class ValuePalette:
 
     def apply_palette(self, value_array: numpy.ndarray) -> numpy.ndarray:
         """Transform a nD array with values into a (n+1)D array with a colour channel."""
-        shape = (*value_array.shape, 3)
-        rgb_array = numpy.ndarray(shape=shape, dtype=float)
-        for index, value in numpy.ndenumerate(value_array):
-            rgb_array[index] = self[value]
-        return rgb_array
+        if self._int_lut is not None and value_array.dtype.kind in "iu":
+            known = len(self._int_lut) - 1
+            indexes = numpy.where(
+                (value_array >= 0) & (value_array < known), value_array, known)
+            return self._int_lut[indexes]
+        uniques, inverse = numpy.unique(value_array, return_inverse=True)
+        lut = numpy.array(
+            [self[value] for value in uniques.tolist()], dtype=numpy.float32)
+        return lut[inverse].reshape(*value_array.shape, 3)
 
     @property
     def colours(self) -> list[RGB]:
@@ -58,6 +76,6 @@ class ValuePalette:
     def from_values(cls, possible_values: list[Scalar], default: Colour = "black") \
             -> "ValuePalette":
         """Create a new ValuePalette with default colours from all possible values."""
-        colour_list = (tuple(map(float, c)) for c in BASE_COLORS.values())
-        palette = {v: next(colour_list) for v in possible_values}
+        palette = {v: BASE_RGB_COLOURS[i % len(BASE_RGB_COLOURS)]
+                   for i, v in enumerate(possible_values)}
         return cls(value_map=palette, default=default)
@@ -22,12 +22,26 @@ TextMap = dict[tuple[int, int], str]
 
 class CellND:
     """Discrete location in a generic nD gridded region."""
-    __slots__ = ["value", "coord_map", "annotation"]
+    __slots__ = ["value", "axes", "coords", "annotation", "_hash"]
 
     def __init__(self, value: Scalar = None, annotation: str = "", **coord_values: int):
         self.value = value
-        self.coord_map = coord_values
+        self.axes = tuple(coord_values.keys())
+        self.coords = tuple(coord_values.values())
         self.annotation = annotation
+        self._hash = hash(self.coords)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def coord_map(self) -> dict[str, int]:
+        """Map each coordinate axis name to its value for this CellND."""
+        return dict(zip(self.axes, self.coords))
+
+    def distance(self, other: "CellND") -> int:
+        """Compute the Manhattan distance between this CellND and another one."""
+        return sum(abs(a - b) for a, b in zip(self.coords, other.coords))
 
 
 class GridNDPlotter:
@@ -46,9 +60,8 @@ class GridNDPlotter:
     def _get_coord_limits(self) -> dict[str, tuple[int, ...]]:
         """Find the lowest and highest values of the stored cells' coordinates."""
         coord_limits = {}
-        coordinates = self._cells[0].coord_map.keys()
-        for c in coordinates:
-            c_values = {cell.coord_map[c] for cell in self._cells}
+        for i, c in enumerate(self._cells[0].axes):
+            c_values = {cell.coords[i] for cell in self._cells}
             coord_limits.update({c: (min(c_values), max(c_values))})
         return coord_limits
 
@@ -111,16 +124,20 @@ class GridNDPlotter:
 
     def _build_target_cells(self, **other_coord_values: int) -> Iterable[CellND]:
         """Filter in stored cells matching target values of non-HV coordinates."""
+        axes = self._cells[0].axes
+        targets = [(axes.index(c), v) for c, v in other_coord_values.items()]
         for cell in self._cells:
-            outside = any(cell.coord_map[c] != v for c, v in other_coord_values.items())
+            outside = any(cell.coords[i] != v for i, v in targets)
             if not outside:
                 yield cell
 
     def _build_hv_cell_map(self, cells: Iterable[CellND], h: str, v: str) \
             -> dict[tuple[int, int], CellND]:
         """Map cells to their target-VH-plane coordinates."""
+        axes = self._cells[0].axes
+        v_i, h_i = axes.index(v), axes.index(h)
         max_v, min_h = self._limits[v][1], self._limits[h][0]
-        return {(max_v - c.coord_map[v], c.coord_map[h] - min_h): c for c in cells}
+        return {(max_v - c.coords[v_i], c.coords[h_i] - min_h): c for c in cells}
 
     def _draw_grid_values(self, axe: Axes, data_array: numpy.ndarray):
         """Add a 2D square tessellation coloured according to the cell values."""
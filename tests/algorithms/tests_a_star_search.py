@@ -0,0 +1,109 @@
+# coding=utf-8
+"""Tests for the A*-search tools."""
+
+# Standard library imports:
+import unittest
+
+# Local application imports:
+from aoc_tools.algorithms.graphs.a_star_search import ASNode, a_star_search
+from aoc_tools.algorithms.graphs.a_star_search import a_star_bidirectional
+from aoc_tools.algorithms.graphs.bucket_queue import BucketQueue
+
+
+class GridNode(ASNode):
+    """Node on a square grid with unit move costs and a zero heuristic."""
+    size = 12
+    expansions = 0
+
+    def __init__(self, x: int, y: int, g: int, parent: "GridNode" = None):
+        super().__init__(id_=(x, y), hash_=hash((x, y)), g=g, h=0, parent=parent)
+        self.x, self.y = x, y
+
+    def get_successors(self) -> list["GridNode"]:
+        """List the up-to-four grid cells adjacent to this GridNode."""
+        type(self).expansions += 1
+        size, g = self.size, self._g + 1
+        nodes = []
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            x, y = self.x + dx, self.y + dy
+            if 0 <= x < size and 0 <= y < size:
+                nodes.append(GridNode(x=x, y=y, g=g, parent=self))
+        return nodes
+
+
+class TriangleNode(ASNode):
+    """Node in a tiny weighted graph with a tempting but suboptimal direct edge."""
+    edges = {"S": {"A": 10, "G": 30}, "A": {"G": 10}}
+    h_costs = {False: {"S": 20, "A": 10, "G": 0}, True: {"S": 0, "A": 10, "G": 20}}
+
+    def __init__(self, id_: str, g: int, backward: bool = False,
+                 parent: "TriangleNode" = None):
+        h = self.h_costs[backward][id_]
+        super().__init__(id_=id_, hash_=hash(id_), g=g, h=h, parent=parent)
+        self.backward = backward
+
+    def get_successors(self) -> list["TriangleNode"]:
+        """List the nodes reachable from this TriangleNode through one edge."""
+        return [TriangleNode(id_=other, g=self._g + cost, parent=self)
+                for other, cost in self.edges.get(self._id, {}).items()]
+
+    def get_predecessors(self) -> list["TriangleNode"]:
+        """List the nodes from which this TriangleNode is reachable through one edge."""
+        return [TriangleNode(id_=other, g=self._g + edges[self._id], backward=True,
+                             parent=self)
+                for other, edges in self.edges.items() if self._id in edges]
+
+
+class GridSearchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Reset the shared expansion counter before each test."""
+        GridNode.expansions = 0
+        self.start = GridNode(x=0, y=0, g=0)
+        self.goal_id = (GridNode.size - 1, GridNode.size - 1)
+
+    def test_goal_is_reached_with_minimum_cost(self):
+        """Assert the search finds the shortest path to the opposite grid corner."""
+        node = a_star_search(start=self.start, goal_func=lambda n: n.id == self.goal_id)
+        self.assertEqual(2 * (GridNode.size - 1), node.g)
+
+    def test_expansions_stay_linear_in_grid_cells(self):
+        """Assert each grid cell is expanded at most once during the search."""
+        a_star_search(start=self.start, goal_func=lambda n: n.id == self.goal_id)
+        self.assertLessEqual(GridNode.expansions, GridNode.size ** 2)
+
+
+class BucketQueueTests(unittest.TestCase):
+    def test_items_pop_in_priority_order(self):
+        """Assert items come out from the lowest to the greatest stored priority."""
+        queue = BucketQueue(max_priority=5)
+        for priority in (2, 0, 5, 1):
+            queue.push(priority, priority)
+        self.assertEqual([0, 1, 2, 5], [queue.pop() for _ in range(len(queue))])
+
+    def test_out_of_bound_priorities_are_rejected(self):
+        """Assert negative or beyond-bound priorities raise instead of mis-sorting."""
+        queue = BucketQueue(max_priority=5)
+        with self.assertRaises(ValueError):
+            queue.push(-1, "negative")
+        with self.assertRaises(ValueError):
+            queue.push(6, "too large")
+
+    def test_search_with_f_bound_matches_heap_search(self):
+        """Assert the bucket-queue search finds the same cost as the heap search."""
+        GridNode.expansions = 0
+        goal_id = (GridNode.size - 1, GridNode.size - 1)
+        node = a_star_search(
+            start=GridNode(x=0, y=0, g=0), goal_func=lambda n: n.id == goal_id,
+            f_bound=2 * GridNode.size)
+        self.assertEqual(2 * (GridNode.size - 1), node.g)
+        self.assertLessEqual(GridNode.expansions, GridNode.size ** 2)
+
+
+class BidirectionalSearchTests(unittest.TestCase):
+    def test_direct_edge_does_not_hide_cheaper_meeting(self):
+        """Assert the searches keep going past a costlier early meeting point."""
+        start = TriangleNode(id_="S", g=0)
+        goal = TriangleNode(id_="G", g=0, backward=True)
+        forward, backward = a_star_bidirectional(start=start, goal=goal)
+        self.assertEqual(forward.id, backward.id)
+        self.assertEqual(20, forward.g + backward.g)